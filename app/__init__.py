@@ -1,10 +1,17 @@
 """LocalScribe Backend - AI-powered grammar and text editing service."""
 
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def _read_version() -> str:
-    """Read version from VERSION file at repository root."""
+    """Read version from installed package metadata, else the VERSION file."""
+    try:
+        return version("localscribe")
+    except PackageNotFoundError:
+        pass
     # VERSION file is at repo root, one level up from app/
     version_file = Path(__file__).parent.parent / "VERSION"
     try:
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Literal
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
 ModelAPIType = Literal["ollama", "openai"]
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a single model target."""
 
@@ -23,16 +22,44 @@ class ModelConfig:
     top_p: float
 
 
-class Settings(BaseSettings):
-    """Pydantic settings wrapper."""
+def _load_env_file(path: str = ".env") -> None:
+    """Load a local .env file into the environment when one exists."""
+    if Path(path).is_file():
+        from dotenv import load_dotenv
+
+        load_dotenv(path, encoding="utf-8")
+
+
+# The strings pydantic accepts for booleans, so env files behave as they did under pydantic-settings.
+_TRUE_VALUES = frozenset({"1", "on", "t", "true", "y", "yes"})
+_FALSE_VALUES = frozenset({"0", "off", "f", "false", "n", "no"})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
 
-    environment: str = Field(default="development", alias="ENVIRONMENT")
-    request_timeout_seconds: float = Field(default=600.0, alias="REQUEST_TIMEOUT_SECONDS")
-    log_level: str = Field(default="INFO", alias="LOG_LEVEL")
-    log_content_enabled: bool = Field(default=False, alias="LOG_CONTENT_ENABLED")
-    config_path: str = Field(default="config/runtime_config.json", alias="CONFIG_PATH")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Process settings read from environment variables."""
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    environment: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "development"))
+    request_timeout_seconds: float = field(
+        default_factory=lambda: float(os.getenv("REQUEST_TIMEOUT_SECONDS", "600.0"))
+    )
+    log_level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    log_content_enabled: bool = field(default_factory=lambda: _env_bool("LOG_CONTENT_ENABLED", False))
+    config_path: str = field(default_factory=lambda: os.getenv("CONFIG_PATH", "config/runtime_config.json"))
+    language_tool_pool_size: int = field(default_factory=lambda: int(os.getenv("LANGUAGE_TOOL_POOL_SIZE", "1")))
 
 
+_load_env_file()
 settings = Settings()
@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import os
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
 
-import httpx
-
-from app.config import settings
 from app.config import ModelConfig
+from app.http_client import get_http_client
+from app.json_utils import dumps_pretty, loads
 
 DEFAULT_RUNTIME_CONFIG = {
     "ollama_base_url": "http://10.8.14.169:11434",
@@ -19,46 +17,88 @@ DEFAULT_RUNTIME_CONFIG = {
     "general_model": "qwen2:7b-instruct",
 }
 
+# key -> (RuntimeConfig model field, temperature, max_tokens, top_p); unknown keys use "general".
+_MODEL_PARAMS: dict[str, tuple[str, float, int, float]] = {
+    "grammar": ("grammar_model", 0.1, 512, 0.95),
+    "analysis": ("grammar_model", 0.1, 512, 0.95),  # Use grammar model for analysis
+    "general": ("general_model", 0.5, 768, 0.9),
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
-    """Runtime configuration persisted to disk."""
+    """Runtime configuration persisted to disk.
+
+    Values are expected to be normalized already; the Ollama endpoints are
+    derived once here rather than formatted on every request.
+    """
 
     ollama_base_url: str
     grammar_model: str
     general_model: str
+    chat_endpoint: str = field(init=False, repr=False, compare=False)
+    tags_endpoint: str = field(init=False, repr=False, compare=False)
+    generate_endpoint: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "chat_endpoint", f"{self.ollama_base_url}/api/chat")
+        object.__setattr__(self, "tags_endpoint", f"{self.ollama_base_url}/api/tags")
+        object.__setattr__(self, "generate_endpoint", f"{self.ollama_base_url}/api/generate")
+
+    def to_dict(self) -> dict[str, str]:
+        """Return the persisted fields."""
+        return {
+            "ollama_base_url": self.ollama_base_url,
+            "grammar_model": self.grammar_model,
+            "general_model": self.general_model,
+        }
 
 
 class ConfigManager:
-    """Loads and persists runtime configuration."""
+    """Loads and persists runtime configuration.
+
+    Nothing touches disk until the config is first accessed. After that,
+    readers never take the lock: writers publish a new immutable snapshot by
+    rebinding attributes, which is atomic under the GIL. The lock only
+    serializes the initial load, writers and the disk write.
+    """
 
     def __init__(self, path: Path) -> None:
         self._path = path
         self._lock = threading.Lock()
-        self._config = self._load()
+        self._config: RuntimeConfig | None = None
+        self._model_configs: dict[str, ModelConfig] = {}
+
+    def _ensure_loaded(self) -> RuntimeConfig:
+        config = self._config
+        if config is None:
+            with self._lock:
+                config = self._config
+                if config is None:
+                    config = self._load()
+                    self._model_configs = self._build_model_configs(config)
+                    self._config = config
+        return config
 
     def _load(self) -> RuntimeConfig:
         self._path.parent.mkdir(parents=True, exist_ok=True)
         if not self._path.exists():
-            self._write(DEFAULT_RUNTIME_CONFIG)
-        with self._path.open("r", encoding="utf-8") as file:
-            data = json.load(file)
+            self._write(RuntimeConfig(**DEFAULT_RUNTIME_CONFIG))
+        data = loads(self._path.read_bytes())
         return RuntimeConfig(
             ollama_base_url=data["ollama_base_url"].strip().rstrip("/"),
             grammar_model=data["grammar_model"].strip(),
             general_model=data["general_model"].strip(),
         )
 
-    def _write(self, data: dict[str, Any]) -> None:
-        self._path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    def _write(self, config: RuntimeConfig) -> None:
+        # Write-then-rename so readers never observe a partially written file.
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_bytes(dumps_pretty(config.to_dict()))
+        os.replace(tmp_path, self._path)
 
     def get_runtime_config(self) -> RuntimeConfig:
-        with self._lock:
-            return RuntimeConfig(
-                ollama_base_url=self._config.ollama_base_url,
-                grammar_model=self._config.grammar_model,
-                general_model=self._config.general_model,
-            )
+        return self._ensure_loaded()
 
     def update_runtime_config(
         self,
@@ -68,57 +108,44 @@ class ConfigManager:
         general_model: str | None = None,
         # analysis_model argument removed
     ) -> RuntimeConfig:
+        self._ensure_loaded()
         with self._lock:
+            current = self._config
             updated = RuntimeConfig(
-                ollama_base_url=(ollama_base_url or self._config.ollama_base_url).strip().rstrip("/"),
-                grammar_model=(grammar_model or self._config.grammar_model).strip(),
-                general_model=(general_model or self._config.general_model).strip(),
-            )
-            self._write(
-                {
-                    "ollama_base_url": updated.ollama_base_url,
-                    "grammar_model": updated.grammar_model,
-                    "general_model": updated.general_model,
-                }
+                ollama_base_url=ollama_base_url.strip().rstrip("/") if ollama_base_url else current.ollama_base_url,
+                grammar_model=grammar_model.strip() if grammar_model else current.grammar_model,
+                general_model=general_model.strip() if general_model else current.general_model,
             )
+            if updated == current:
+                return current
+            self._write(updated)
+            self._model_configs = self._build_model_configs(updated)
             self._config = updated
-            return RuntimeConfig(
-                ollama_base_url=updated.ollama_base_url,
-                grammar_model=updated.grammar_model,
-                general_model=updated.general_model,
+            return updated
+
+    @staticmethod
+    def _build_model_configs(config: RuntimeConfig) -> dict[str, ModelConfig]:
+        """Precompute the model config for each logical key."""
+        return {
+            key: ModelConfig(
+                name=getattr(config, model_field),
+                endpoint=config.chat_endpoint,
+                api_type="ollama",
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
             )
+            for key, (model_field, temperature, max_tokens, top_p) in _MODEL_PARAMS.items()
+        }
 
     def get_model_config(self, key: str) -> ModelConfig:
-        config = self.get_runtime_config()
-        
-        if key == "grammar" or key == "analysis": # Use grammar model for analysis
-            model_name = config.grammar_model
-            temperature = 0.1
-            max_tokens = 512
-            top_p = 0.95
-        else: # general
-            model_name = config.general_model
-            temperature = 0.5
-            max_tokens = 768
-            top_p = 0.9
-
-        endpoint = f"{config.ollama_base_url}/api/chat"
-        
-        return ModelConfig(
-            name=model_name,
-            endpoint=endpoint,
-            api_type="ollama",
-            temperature=temperature,
-            max_tokens=max_tokens,
-            top_p=top_p,
-        )
+        self._ensure_loaded()
+        model_configs = self._model_configs
+        return model_configs.get(key) or model_configs["general"]
 
     async def list_available_models(self) -> list[str]:
-        config = self.get_runtime_config()
-        url = f"{config.ollama_base_url}/api/tags"
-        async with httpx.AsyncClient(timeout=settings.request_timeout_seconds) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            payload = response.json()
+        response = await get_http_client().get(self._ensure_loaded().tags_endpoint)
+        response.raise_for_status()
+        payload = loads(await response.aread())
         models = payload.get("models") or []
         return [model.get("name") or model.get("model") for model in models if model.get("name") or model.get("model")]
\ No newline at end of file
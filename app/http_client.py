@@ -0,0 +1,28 @@
+"""Shared HTTP client for downstream Ollama/OpenAI calls."""
+
+from __future__ import annotations
+
+import httpx
+
+from app.config import settings
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.request_timeout_seconds,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client and drop pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, TypeVar
 
 import httpx
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.openapi.utils import REF_TEMPLATE, validation_error_definition, validation_error_response_definition
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ValidationError
 
 from app import __version__, schemas
 from app.config import settings
 from app.config_manager import ConfigManager
+from app.http_client import close_http_client, get_http_client
 from app.logging_utils import configure_logging, get_logger
-from app.models.client import ModelClientError
+from app.models.client import OLLAMA_KEEP_ALIVE, ModelClientError
 from app.services.editing import EditResult, EditingService
 from app.services.grammar_check import GrammarCheckService
 from app.services.analysis import AnalysisService
@@ -22,8 +32,101 @@ logger = get_logger(__name__)
 
 app = FastAPI(title="LocalScribe Backend")
 config_manager = ConfigManager(Path(settings.config_path))
-grammar_service = GrammarCheckService()
-analysis_service = AnalysisService(config_manager=config_manager, timeout=settings.request_timeout_seconds)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def json_body(model: type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """Build a dependency that validates the raw request bytes with the model's compiled validator.
+
+    This skips FastAPI's json.loads + dict validation round trip on hot routes.
+    Validation failures still surface as the usual 422 response.
+    """
+
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as exc:
+            errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+            raise RequestValidationError(errors) from exc
+
+    return dependency
+
+
+# Request models read through json_body(); FastAPI can't see them, so openapi() adds them.
+_json_body_models: list[type[BaseModel]] = []
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict[str, Any]:
+    """Describe a json_body() request body and its 422 response for the OpenAPI schema."""
+    _json_body_models.append(model)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": REF_TEMPLATE.format(model=model.__name__)}}},
+        },
+        "responses": {
+            "422": {
+                "description": "Validation Error",
+                "content": {
+                    "application/json": {"schema": {"$ref": REF_TEMPLATE.format(model="HTTPValidationError")}}
+                },
+            }
+        },
+    }
+
+
+_default_openapi = app.openapi
+
+
+def openapi() -> dict[str, Any]:
+    """Build the default schema, then register the json_body() request models as components."""
+    if app.openapi_schema is None:
+        schema = _default_openapi()
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        for model in _json_body_models:
+            model_schema = model.model_json_schema(ref_template=REF_TEMPLATE)
+            components.update(model_schema.pop("$defs", {}))
+            components[model.__name__] = model_schema
+        components.setdefault("ValidationError", validation_error_definition)
+        components.setdefault("HTTPValidationError", validation_error_response_definition)
+    return app.openapi_schema
+
+
+app.openapi = openapi  # type: ignore[method-assign]
+
+
+def json_response(model: BaseModel) -> Response:
+    """Serialize a response model in pydantic-core, skipping FastAPI's re-validation and dict round trip.
+
+    Routes using this still declare response_model so the OpenAPI schema stays accurate.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+@app.on_event("startup")
+async def schedule_model_warmup() -> None:
+    """Load the grammar model in the background so the first request skips the load."""
+    app.state.warmup_task = asyncio.create_task(_warmup_in_background())
+
+
+async def _warmup_in_background() -> None:
+    """Best-effort warmup; failures are logged and never escape the task."""
+    try:
+        await warmup_model()
+    except HTTPException:
+        pass  # Already logged by warmup_model; the endpoint can be retried later.
+    except Exception:
+        logger.exception("Background model warmup failed")
+
+
+@app.on_event("shutdown")
+async def shutdown_http_client() -> None:
+    """Release pooled connections on shutdown."""
+    warmup_task = getattr(app.state, "warmup_task", None)
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await close_http_client()
 
 
 @lru_cache(maxsize=1)
@@ -32,10 +135,25 @@ def get_editing_service() -> EditingService:
     return EditingService(config_manager=config_manager, timeout=settings.request_timeout_seconds)
 
 
+@lru_cache(maxsize=1)
+def get_grammar_service() -> GrammarCheckService:
+    """Instantiate the LanguageTool-backed grammar service on first use."""
+    return GrammarCheckService(pool_size=settings.language_tool_pool_size)
+
+
+@lru_cache(maxsize=1)
+def get_analysis_service() -> AnalysisService:
+    """Instantiate the analysis service."""
+    return AnalysisService(config_manager=config_manager, timeout=settings.request_timeout_seconds)
+
+
 @app.get("/health", response_model=schemas.HealthResponse)
-async def health() -> schemas.HealthResponse:
+async def health(
+    grammar_service: GrammarCheckService = Depends(get_grammar_service),
+) -> schemas.HealthResponse:
     """Simple health-check endpoint."""
-    lt_status = "ok" if grammar_service.is_enabled() else "disabled"
+    # LanguageTool starts on the first check; until then it is ready, not failed.
+    lt_status = "disabled" if grammar_service.is_enabled() is False else "ok"
     lt_error = grammar_service.get_init_error()
     return schemas.HealthResponse(
         status="ok",
@@ -82,20 +200,20 @@ async def list_available_models() -> schemas.ModelListResponse:
 async def warmup_model() -> dict:
     """Send a minimal request to Ollama to load the model into memory."""
     config = config_manager.get_runtime_config()
-    url = f"{config.ollama_base_url}/api/generate"
+    url = config.generate_endpoint
 
     # Minimal request to trigger model loading
     payload = {
         "model": config.grammar_model,
         "prompt": "",
         "stream": False,
+        "keep_alive": OLLAMA_KEEP_ALIVE,
         "options": {"num_predict": 1}
     }
 
     try:
-        async with httpx.AsyncClient(timeout=600.0) as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
+        response = await get_http_client().post(url, json=payload, timeout=600.0)
+        response.raise_for_status()
         logger.info(f"Model warmup complete: {config.grammar_model}")
         return {"status": "ok", "model": config.grammar_model}
     except httpx.HTTPError as exc:
@@ -106,17 +224,27 @@ async def warmup_model() -> dict:
         ) from exc
 
 
-@app.post("/v1/text/check", response_model=schemas.CheckResponse)
-async def check_text(payload: schemas.CheckRequest) -> schemas.CheckResponse:
+@app.post(
+    "/v1/text/check",
+    response_model=schemas.CheckResponse,
+    openapi_extra=json_body_openapi(schemas.CheckRequest),
+)
+async def check_text(
+    payload: schemas.CheckRequest = Depends(json_body(schemas.CheckRequest)),
+    grammar_service: GrammarCheckService = Depends(get_grammar_service),
+) -> Response:
     """Check text for grammar errors using LanguageTool."""
-    return grammar_service.check(payload.text, payload.language_tool_config)
+    return json_response(await grammar_service.check(payload.text, payload.language_tool_config))
 
 
 @app.post("/v1/text/analyze", response_model=schemas.AnalysisResponse)
-async def analyze_text(payload: schemas.AnalysisRequest) -> schemas.AnalysisResponse:
+async def analyze_text(
+    payload: schemas.AnalysisRequest,
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+) -> Response:
     """Analyze text for semantic clarity using LLM."""
     try:
-        return await analysis_service.analyze(payload.text)
+        result = await analysis_service.analyze(payload.text)
     except Exception as exc:
         logger.exception("Analysis failed")
         raise HTTPException(
@@ -124,12 +252,53 @@ async def analyze_text(payload: schemas.AnalysisRequest) -> schemas.AnalysisResp
             detail=f"Analysis failed: {exc}",
         ) from exc
 
+    return json_response(result)
+
+
+@app.post("/v1/text/analyze/stream")
+async def analyze_text_stream(
+    payload: schemas.AnalysisRequest,
+    analysis_service: AnalysisService = Depends(get_analysis_service),
+) -> StreamingResponse:
+    """Stream analysis issues as NDJSON, one AnalysisIssue per line, as the LLM reports them.
+
+    Failures before the first issue return 502 like /v1/text/analyze; later ones
+    end the stream with a final ``{"error": ...}`` line.
+    """
+    issues = analysis_service.stream_issues(payload.text)
+    try:
+        # Wait for the first issue so connection and HTTP errors surface before headers are sent.
+        first = await anext(issues, None)
+    except Exception as exc:
+        logger.exception("Streaming analysis failed")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Analysis failed: {exc}",
+        ) from exc
+
+    async def issue_lines() -> AsyncIterator[str]:
+        if first is None:
+            return
+        yield first.model_dump_json() + "\n"
+        try:
+            async for issue in issues:
+                yield issue.model_dump_json() + "\n"
+        except Exception as exc:
+            logger.exception("Streaming analysis failed")
+            yield json.dumps({"error": f"Analysis failed: {exc}"}) + "\n"
 
-@app.post("/v1/text/edit", response_model=schemas.EditResponse)
+    return StreamingResponse(issue_lines(), media_type="application/x-ndjson")
+
+
+@app.post(
+    "/v1/text/edit",
+    response_model=schemas.EditResponse,
+    openapi_extra=json_body_openapi(schemas.EditRequest),
+)
 async def edit_text(
-    payload: schemas.EditRequest,
+    payload: schemas.EditRequest = Depends(json_body(schemas.EditRequest)),
     service: EditingService = Depends(get_editing_service),
-) -> schemas.EditResponse:
+) -> Response:
     """Main editing endpoint."""
     try:
         result: EditResult = await service.edit(
@@ -145,26 +314,29 @@ async def edit_text(
             detail=f"Model request failed: {exc}",
         ) from exc
 
-    text_preview = ""
-    if settings.log_content_enabled:  # pragma: no cover
-        text_preview = f" preview={payload.text[:200]!r}"
-
-    logger.info(
-        "Edit request processed | mode=%s model=%s latency_ms=%.2f text_len=%d%s",
-        result.mode,
-        result.model_config.name,
-        result.latency_ms,
-        len(payload.text),
-        text_preview,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        text_preview = ""
+        if settings.log_content_enabled:  # pragma: no cover
+            text_preview = f" preview={payload.text[:200]!r}"
 
-    return schemas.EditResponse(
-        mode=result.mode,
-        model=schemas.ModelInfo(
-            name=result.model_config.name,
-            endpoint=result.model_config.endpoint,
-            api_type=result.model_config.api_type,
-        ),
-        output_text=result.output_text,
-        latency_ms=result.latency_ms,
+        logger.info(
+            "Edit request processed | mode=%s model=%s latency_ms=%.2f text_len=%d%s",
+            result.mode,
+            result.model_config.name,
+            result.latency_ms,
+            len(payload.text),
+            text_preview,
+        )
+
+    return json_response(
+        schemas.EditResponse(
+            mode=result.mode,
+            model=schemas.ModelInfo(
+                name=result.model_config.name,
+                endpoint=result.model_config.endpoint,
+                api_type=result.model_config.api_type,
+            ),
+            output_text=result.output_text,
+            latency_ms=result.latency_ms,
+        )
     )
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
 from app.config import ModelConfig
+from app.http_client import get_http_client
+from app.json_utils import loads
+
+# Negative keep_alive tells Ollama to keep the model loaded indefinitely.
+OLLAMA_KEEP_ALIVE = -1
 
 
 class ModelClientError(RuntimeError):
     """Raised when a downstream model call fails."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Minimal structure describing a chat message."""
 
@@ -22,81 +28,152 @@ class ChatMessage:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call request from the model."""
     name: str
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
     """Structured response from the model."""
     content: str
     tool_calls: list[ToolCall] | None = None
 
 
+def _parse_tool_calls(raw_tool_calls: list[dict[str, Any]]) -> list[ToolCall]:
+    """Convert raw tool-call entries into ToolCall objects, skipping ones without a function."""
+    tool_call = ToolCall
+    return [
+        tool_call(name=func.get("name", ""), arguments=func.get("arguments", {}))
+        for tc in raw_tool_calls
+        if (func := tc.get("function"))
+    ]
+
+
 class ModelClient:
     """HTTP client for Ollama or OpenAI-compatible chat endpoints."""
 
-    def __init__(self, config: ModelConfig, *, timeout: float = 120.0) -> None:
+    def __init__(
+        self,
+        config: ModelConfig,
+        *,
+        timeout: float = 120.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
         self.config = config
         self.timeout = timeout
+        # Resolved per call when not injected, so pooled clients survive a
+        # shared HTTP client being closed and recreated.
+        self._client = client
+        self._payload_template = self._build_payload_template()
 
     async def generate(
         self, 
         messages: list[dict[str, str]], 
-        tools: list[dict[str, Any]] | None = None
+        tools: list[dict[str, Any]] | None = None,
+        *,
+        prompt_cache_key: str | None = None,
     ) -> ModelResponse:
-        """Call the downstream model with the constructed messages and optional tools."""
-        payload = self._build_payload(messages, tools)
+        """Call the downstream model with the constructed messages and optional tools.
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(self.config.endpoint, json=payload)
-                response.raise_for_status()
-            except httpx.HTTPError as exc:
-                raise ModelClientError(str(exc)) from exc
+        ``prompt_cache_key`` groups requests sharing a message prefix so
+        OpenAI-style servers can reuse the cached prefill. Ollama has no such
+        field; it reuses the prefix of a loaded model on its own.
+        """
+        payload = self._build_payload(messages, tools, prompt_cache_key)
+
+        try:
+            response = await (self._client or get_http_client()).post(self.config.endpoint, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise ModelClientError(str(exc)) from exc
 
-        data = response.json()
+        data = loads(await response.aread())
         return self._parse_response(data)
 
-    def _build_payload(
-        self, 
-        messages: list[dict[str, str]], 
-        tools: list[dict[str, Any]] | None = None
-    ) -> dict[str, Any]:
-        """Translate messages and tools to the downstream API shape."""
-        payload: dict[str, Any] = {
-            "model": self.config.name,
-            "messages": messages,
-        }
+    async def stream(
+        self,
+        messages: list[dict[str, str]],
+        tools: list[dict[str, Any]] | None = None,
+        *,
+        prompt_cache_key: str | None = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """Yield partial responses as the downstream model produces them.
+
+        Each Ollama NDJSON chunk becomes one ModelResponse carrying the unstripped
+        content delta and any tool calls completed in that chunk. Other API types
+        fall back to a single buffered response.
+        """
+        if self.config.api_type != "ollama":
+            yield await self.generate(messages, tools, prompt_cache_key=prompt_cache_key)
+            return
+
+        payload = self._build_payload(messages, tools)
+        payload["stream"] = True
 
+        try:
+            async with (self._client or get_http_client()).stream(
+                "POST", self.config.endpoint, json=payload, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = loads(line)
+                    if "error" in chunk:
+                        raise ModelClientError(f"Ollama stream error: {chunk['error']}")
+                    message = chunk.get("message") or {}
+                    raw_tool_calls = message.get("tool_calls")
+                    yield ModelResponse(
+                        content=message.get("content", ""),
+                        tool_calls=(_parse_tool_calls(raw_tool_calls) or None) if raw_tool_calls else None,
+                    )
+        except httpx.HTTPError as exc:
+            raise ModelClientError(str(exc)) from exc
+
+    def _build_payload_template(self) -> dict[str, Any]:
+        """Translate the static model settings to the downstream API shape."""
         # Ollama API structure
         if self.config.api_type == "ollama":
-            payload["stream"] = False
-            payload["options"] = {
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens,
-                "top_p": self.config.top_p,
+            return {
+                "model": self.config.name,
+                "stream": False,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+                "options": {
+                    "temperature": self.config.temperature,
+                    "num_predict": self.config.max_tokens,
+                    "top_p": self.config.top_p,
+                },
             }
-            if tools:
-                payload["tools"] = tools
-            return payload
 
         # Generic/OpenAI structure
-        payload["temperature"] = self.config.temperature
-        payload["max_tokens"] = self.config.max_tokens
-        payload["top_p"] = self.config.top_p
+        return {
+            "model": self.config.name,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+
+    def _build_payload(
+        self, 
+        messages: list[dict[str, str]], 
+        tools: list[dict[str, Any]] | None = None,
+        prompt_cache_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Attach per-call messages, tools and cache key to the prebuilt template."""
+        payload = {**self._payload_template, "messages": messages}
         if tools:
             payload["tools"] = tools
-        
+        if prompt_cache_key and self.config.api_type != "ollama":
+            payload["prompt_cache_key"] = prompt_cache_key
         return payload
 
     def _parse_response(self, payload: dict[str, Any]) -> ModelResponse:
         """Extract text and tool calls from responses."""
         content = ""
-        tool_calls = []
+        tool_calls: list[ToolCall] | None = None
 
         if self.config.api_type == "ollama":
             message = payload.get("message")
@@ -108,13 +185,7 @@ class ModelClient:
             # Parse tool calls if present
             raw_tool_calls = message.get("tool_calls")
             if raw_tool_calls:
-                for tc in raw_tool_calls:
-                    func = tc.get("function", {})
-                    if func:
-                        tool_calls.append(ToolCall(
-                            name=func.get("name", ""),
-                            arguments=func.get("arguments", {})
-                        ))
+                tool_calls = _parse_tool_calls(raw_tool_calls)
 
         else:
             # OpenAI compatible parsing
@@ -127,18 +198,26 @@ class ModelClient:
             
             raw_tool_calls = message.get("tool_calls")
             if raw_tool_calls:
-                for tc in raw_tool_calls:
-                    func = tc.get("function", {})
-                    if func:
-                        # OpenAI arguments are often strings, need parsing if not dict
-                        # But simpler compatible APIs might return dicts. 
-                        # Assuming dict for now as we mostly target Ollama/local.
-                        args = func.get("arguments", {})
-                        # If args is string (standard OpenAI), we'd need json.loads(args)
-                        # but keeping simple for now.
-                        tool_calls.append(ToolCall(
-                            name=func.get("name", ""),
-                            arguments=args
-                        ))
-
-        return ModelResponse(content=content, tool_calls=tool_calls if tool_calls else None)
\ No newline at end of file
+                # OpenAI arguments are often strings, need parsing if not dict
+                # But simpler compatible APIs might return dicts. 
+                # Assuming dict for now as we mostly target Ollama/local.
+                # If args is string (standard OpenAI), we'd need json.loads(args)
+                # but keeping simple for now.
+                tool_calls = _parse_tool_calls(raw_tool_calls)
+
+        return ModelResponse(content=content, tool_calls=tool_calls or None)
+
+
+class ModelClientPool:
+    """Reuses one ModelClient per logical model key until that key's config changes."""
+
+    def __init__(self, *, timeout: float) -> None:
+        self._timeout = timeout
+        self._clients: dict[str, ModelClient] = {}
+
+    def get(self, key: str, config: ModelConfig) -> ModelClient:
+        """Return the pooled client for key, rebuilding it if config was replaced."""
+        client = self._clients.get(key)
+        if client is None or client.config is not config:
+            client = self._clients[key] = ModelClient(config, timeout=self._timeout)
+        return client
\ No newline at end of file
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import sys
+from functools import cached_property
 from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator, model_validator
 
 from app.config_manager import RuntimeConfig
 from app.types import Mode, ToneStyle
 
 
-class HealthResponse(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for models built once per response and only serialized afterwards."""
+
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
+
+class HealthResponse(ResponseModel):
     """Response model for /health."""
 
     status: str
@@ -20,7 +28,7 @@ class HealthResponse(BaseModel):
     language_tool_error: str | None = None
 
 
-class ModelInfo(BaseModel):
+class ModelInfo(ResponseModel):
     """Metadata returned to the client describing the target model."""
 
     name: str
@@ -46,7 +54,8 @@ class EditRequest(BaseModel):
     @classmethod
     def strip_text(cls, value: str) -> str:
         """Ensure text contains non-whitespace characters."""
-        if not value.strip():
+        # isspace() stops at the first visible character and never copies the text.
+        if not value or value.isspace():
             raise ValueError("Text must contain non-whitespace characters.")
         return value
 
@@ -59,7 +68,7 @@ class EditRequest(BaseModel):
         return self
 
 
-class EditResponse(BaseModel):
+class EditResponse(ResponseModel):
     """Response payload for editing calls."""
 
     mode: Mode
@@ -68,7 +77,7 @@ class EditResponse(BaseModel):
     latency_ms: float
 
 
-class RuntimeConfigResponse(BaseModel):
+class RuntimeConfigResponse(ResponseModel):
     """REPresents backend runtime configuration."""
 
     ollama_base_url: HttpUrl
@@ -100,6 +109,11 @@ class LanguageToolConfig(BaseModel):
         description="List of category IDs to disable (e.g., 'STYLE', 'TYPOGRAPHY')",
     )
 
+    @cached_property
+    def disabled_categories_upper(self) -> frozenset[str]:
+        """Upper-cased, interned category IDs for per-match membership tests."""
+        return frozenset(sys.intern(cat.upper()) for cat in self.disabled_categories)
+
 
 class CheckRequest(BaseModel):
     """Request payload for /v1/text/check."""
@@ -111,7 +125,7 @@ class CheckRequest(BaseModel):
     )
 
 
-class GrammarError(BaseModel):
+class GrammarError(ResponseModel):
     """Represents a single grammar error found by LanguageTool."""
 
     message: str
@@ -125,14 +139,14 @@ class GrammarError(BaseModel):
     offset_in_context: int = 0     # Position of error within context
 
 
-class CheckResponse(BaseModel):
+class CheckResponse(ResponseModel):
     """Response payload for grammar checking."""
 
     matches: list[GrammarError]
     error: str | None = None
 
 
-class ModelListResponse(BaseModel):
+class ModelListResponse(ResponseModel):
     """List of available models reported by Ollama."""
 
     models: list[str]
@@ -145,7 +159,7 @@ class AnalysisRequest(BaseModel):
     text: str = Field(..., min_length=1, description="Text to analyze.")
 
 
-class AnalysisIssue(BaseModel):
+class AnalysisIssue(ResponseModel):
     """Represents a semantic clarity issue found by the LLM."""
     
     offset: int
@@ -156,7 +170,7 @@ class AnalysisIssue(BaseModel):
     confidence: float = 1.0
 
 
-class AnalysisResponse(BaseModel):
+class AnalysisResponse(ResponseModel):
     """Response payload for text analysis."""
     
     issues: list[AnalysisIssue]
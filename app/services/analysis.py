@@ -2,10 +2,13 @@
 
 import logging
 import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
 
 from app.config_manager import ConfigManager
-from app.models.client import ModelClient
+from app.models.client import ModelClientPool, ToolCall
 from app.schemas import AnalysisResponse, AnalysisIssue
+from app.text_search import find_first_offsets
 
 logger = logging.getLogger(__name__)
 
@@ -51,120 +54,103 @@ CLARITY_TOOL = {
 }
 
 
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a highly critical and precise semantic editor. Your task is to analyze the provided text ONLY for clarity and readability issues. "
+        "Specifically identify and report: "
+        "1. **Passive Voice**: Highlight sentences where the subject is acted upon. "
+        "2. **Wordiness/Redundancy**: Identify phrases that can be shortened without losing meaning. "
+        "3. **Complexity**: Pinpoint overly long, convoluted sentences or phrases that hinder understanding. "
+        "4. **Jargon**: Flag technical terms that might be unclear to a general audience. "
+        "5. **Tone Inconsistency**: Note parts where the tone deviates from a clear, direct style (e.g., overly formal, hedging). "
+        "Use the 'report_clarity_issues' tool to report your findings. "
+        "For each issue, provide the EXACT problematic substring from the user's input and a concise, actionable suggestion for improvement. "
+        "If you find ANY issues, you MUST call the 'report_clarity_issues' tool. If no issues are found, do not call the tool."
+    )
+}
+
+# Few-shot example, only sent for short inputs: on long texts it mostly adds prefill
+# tokens (and latency) while the text itself gives the model enough to work with.
+FEW_SHOT_MESSAGES = (
+    {
+        "role": "user",
+        "content": "It is anticipated that a decision will be made by us at some point in time. The situation was being evaluated."
+    },
+    {
+        "role": "assistant",
+        "tool_calls": [
+            {
+                "function": {
+                    "name": "report_clarity_issues",
+                    "arguments": {
+                        "issues": [
+                            {
+                                "quoted_text": "It is anticipated that a decision will be made by us",
+                                "issue_type": "passive_voice",
+                                "suggestion": "We anticipate a decision",
+                                "confidence": 0.9
+                            },
+                            {
+                                "quoted_text": "at some point in time",
+                                "issue_type": "wordiness",
+                                "suggestion": "eventually",
+                                "confidence": 0.95
+                            },
+                            {
+                                "quoted_text": "The situation was being evaluated",
+                                "issue_type": "passive_voice",
+                                "suggestion": "We were evaluating the situation",
+                                "confidence": 0.85
+                            }
+                        ]
+                    }
+                }
+            }
+        ]
+    },
+)
+FEW_SHOT_MAX_WORDS = 50
+
+# Static message prefixes, built once and shared by every request.
+# Analysis requests share the system prompt, so they share one prompt cache key.
+PROMPT_CACHE_KEY = "localscribe-analysis"
+
+_PREFIX: tuple[dict[str, Any], ...] = (SYSTEM_MESSAGE,)
+_PREFIX_WITH_FEW_SHOT: tuple[dict[str, Any], ...] = (SYSTEM_MESSAGE, *FEW_SHOT_MESSAGES)
+
+
 class AnalysisService:
     """Service for semantic text analysis."""
 
     def __init__(self, *, config_manager: ConfigManager, timeout: float) -> None:
         self._config_manager = config_manager
-        self._timeout = timeout
+        self._clients = ModelClientPool(timeout=timeout)
 
     async def analyze(self, text: str) -> AnalysisResponse:
         """Analyze text for semantic clarity issues."""
         model_config = self._config_manager.get_model_config("analysis")
-        client = ModelClient(model_config, timeout=self._timeout)
-
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a highly critical and precise semantic editor. Your task is to analyze the provided text ONLY for clarity and readability issues. "
-                    "Specifically identify and report: "
-                    "1. **Passive Voice**: Highlight sentences where the subject is acted upon. "
-                    "2. **Wordiness/Redundancy**: Identify phrases that can be shortened without losing meaning. "
-                    "3. **Complexity**: Pinpoint overly long, convoluted sentences or phrases that hinder understanding. "
-                    "4. **Jargon**: Flag technical terms that might be unclear to a general audience. "
-                    "5. **Tone Inconsistency**: Note parts where the tone deviates from a clear, direct style (e.g., overly formal, hedging). "
-                    "Use the 'report_clarity_issues' tool to report your findings. "
-                    "For each issue, provide the EXACT problematic substring from the user's input and a concise, actionable suggestion for improvement. "
-                    "If you find ANY issues, you MUST call the 'report_clarity_issues' tool. If no issues are found, do not call the tool."
-                )
-            },
-            # Few-shot example
-            {
-                "role": "user",
-                "content": "It is anticipated that a decision will be made by us at some point in time. The situation was being evaluated."
-            },
-            {
-                "role": "assistant",
-                "tool_calls": [
-                    {
-                        "function": {
-                            "name": "report_clarity_issues",
-                            "arguments": {
-                                "issues": [
-                                    {
-                                        "quoted_text": "It is anticipated that a decision will be made by us",
-                                        "issue_type": "passive_voice",
-                                        "suggestion": "We anticipate a decision",
-                                        "confidence": 0.9
-                                    },
-                                    {
-                                        "quoted_text": "at some point in time",
-                                        "issue_type": "wordiness",
-                                        "suggestion": "eventually",
-                                        "confidence": 0.95
-                                    },
-                                    {
-                                        "quoted_text": "The situation was being evaluated",
-                                        "issue_type": "passive_voice",
-                                        "suggestion": "We were evaluating the situation",
-                                        "confidence": 0.85
-                                    }
-                                ]
-                            }
-                        }
-                    }
-                ]
-            },
-            {"role": "user", "content": text},
-        ]
+        client = self._clients.get("analysis", model_config)
+        messages = self._build_messages(text)
 
         start = time.perf_counter()
-        logger.info(f"Analysis starting | model={model_config.name} text_len={len(text)}")
+        logger.info("Analysis starting | model=%s text_len=%d", model_config.name, len(text))
 
         try:
-            response = await client.generate(messages, tools=[CLARITY_TOOL])
-            logger.info(f"Analysis LLM responded in {(time.perf_counter() - start)*1000:.0f}ms")
+            response = await client.generate(messages, tools=[CLARITY_TOOL], prompt_cache_key=PROMPT_CACHE_KEY)
         except Exception as e:
-            logger.error(f"Analysis model call failed after {(time.perf_counter() - start)*1000:.0f}ms: {e}")
+            logger.error("Analysis model call failed after %.0fms: %s", (time.perf_counter() - start) * 1000, e)
             raise  # Propagate error to caller instead of silent empty response
 
         latency_ms = (time.perf_counter() - start) * 1000
+        logger.info("Analysis LLM responded in %.0fms", latency_ms)
 
         issues: list[AnalysisIssue] = []
 
         if response.tool_calls:
-            logger.info(f"LLM returned {len(response.tool_calls)} tool calls.")
+            logger.info("LLM returned %d tool calls.", len(response.tool_calls))
             for tool_call in response.tool_calls:
-                if tool_call.name == "report_clarity_issues":
-                    raw_issues = tool_call.arguments.get("issues", [])
-
-                    for item in raw_issues:
-                        quoted = item.get("quoted_text", "")
-                        issue_type = item.get("issue_type", "complexity")
-                        suggestion = item.get("suggestion", "")
-                        confidence = float(item.get("confidence", 1.0))
-
-                        if not quoted or not suggestion:
-                            logger.warning(f"Malformed issue from LLM: quoted_text='{quoted}', suggestion='{suggestion}'")
-                            continue
-
-                        # Find exact position in text
-                        offset = text.find(quoted)
-
-                        if offset != -1:
-                            issues.append(AnalysisIssue(
-                                offset=offset,
-                                length=len(quoted),
-                                quoted_text=quoted,
-                                issue_type=issue_type,
-                                suggestion=suggestion,
-                                confidence=confidence
-                            ))
-                        else:
-                            logger.warning(f"LLM hallucinated quote not found in text: '{quoted}' (Issue Type: {issue_type}, Suggestion: '{suggestion}')")
-                else:
-                    logger.warning(f"LLM called unknown tool: {tool_call.name}")
+                issues.extend(self._issues_from_tool_call(text, tool_call))
         else:
             logger.info("LLM did not return any tool calls for analysis.")
 
@@ -176,3 +162,78 @@ class AnalysisService:
         )
 
         return AnalysisResponse(issues=issues, latency_ms=latency_ms)
+
+    async def stream_issues(self, text: str) -> AsyncIterator[AnalysisIssue]:
+        """Yield issues as soon as the model emits each tool call, instead of after the full reply."""
+        model_config = self._config_manager.get_model_config("analysis")
+        client = self._clients.get("analysis", model_config)
+        messages = self._build_messages(text)
+
+        start = time.perf_counter()
+        logger.info("Streaming analysis starting | model=%s text_len=%d", model_config.name, len(text))
+
+        count = 0
+        async for chunk in client.stream(messages, tools=[CLARITY_TOOL], prompt_cache_key=PROMPT_CACHE_KEY):
+            for tool_call in chunk.tool_calls or ():
+                for issue in self._issues_from_tool_call(text, tool_call):
+                    count += 1
+                    yield issue
+
+        logger.info(
+            "Streaming analysis completed | model=%s latency_ms=%.2f issues=%d",
+            model_config.name,
+            (time.perf_counter() - start) * 1000,
+            count,
+        )
+
+    @staticmethod
+    def _build_messages(text: str) -> list[dict[str, Any]]:
+        """Assemble the system prompt, the few-shot example for short texts, and the user text."""
+        # maxsplit caps the work at FEW_SHOT_MAX_WORDS pieces however long the text is.
+        short = len(text.split(maxsplit=FEW_SHOT_MAX_WORDS - 1)) < FEW_SHOT_MAX_WORDS
+        prefix = _PREFIX_WITH_FEW_SHOT if short else _PREFIX
+        return [*prefix, {"role": "user", "content": text}]
+
+    @staticmethod
+    def _issues_from_tool_call(text: str, tool_call: ToolCall) -> Iterator[AnalysisIssue]:
+        """Locate each reported issue in the original text, dropping malformed or hallucinated ones."""
+        if tool_call.name != "report_clarity_issues":
+            logger.warning("LLM called unknown tool: %s", tool_call.name)
+            return
+
+        raw_issues = tool_call.arguments.get("issues", [])
+        warn = logger.isEnabledFor(logging.WARNING)
+
+        candidates: list[tuple[str, str, str, float]] = []
+        for item in raw_issues:
+            quoted = item.get("quoted_text", "")
+            issue_type = item.get("issue_type", "complexity")
+            suggestion = item.get("suggestion", "")
+            confidence = float(item.get("confidence", 1.0))
+
+            if not quoted or not suggestion:
+                if warn:
+                    logger.warning("Malformed issue from LLM: quoted_text='%s', suggestion='%s'", quoted, suggestion)
+                continue
+            candidates.append((quoted, issue_type, suggestion, confidence))
+
+        # Find exact positions in text with one pass for all quotes
+        offsets = find_first_offsets(text, [candidate[0] for candidate in candidates])
+
+        for (quoted, issue_type, suggestion, confidence), offset in zip(candidates, offsets):
+            if offset != -1:
+                yield AnalysisIssue(
+                    offset=offset,
+                    length=len(quoted),
+                    quoted_text=quoted,
+                    issue_type=issue_type,
+                    suggestion=suggestion,
+                    confidence=confidence
+                )
+            elif warn:
+                logger.warning(
+                    "LLM hallucinated quote not found in text: '%s' (Issue Type: %s, Suggestion: '%s')",
+                    quoted,
+                    issue_type,
+                    suggestion,
+                )
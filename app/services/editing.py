@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from app.config import ModelConfig
 from app.config_manager import ConfigManager
 from app.logging_utils import get_logger
-from app.models.client import ModelClient
+from app.models.client import ModelClientPool
 from app.models.routers import resolve_model_key
 from app.prompts import build_messages
 from app.types import Mode, ToneStyle
@@ -31,7 +31,7 @@ class EditingService:
 
     def __init__(self, *, config_manager: ConfigManager, timeout: float) -> None:
         self._config_manager = config_manager
-        self._timeout = timeout
+        self._clients = ModelClientPool(timeout=timeout)
 
     async def edit(
         self,
@@ -44,7 +44,7 @@ class EditingService:
         """Route request to the correct model and return structured result."""
         model_key = resolve_model_key(mode)
         model_config = self._config_manager.get_model_config(model_key)
-        client = ModelClient(model_config, timeout=self._timeout)
+        client = self._clients.get(model_key, model_config)
 
         messages = build_messages(
             text=text,
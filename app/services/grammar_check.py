@@ -2,81 +2,176 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
-import language_tool_python
-from app.schemas import CheckResponse, GrammarError, LanguageToolConfig
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from app.schemas import CheckResponse, LanguageToolConfig
+
+if TYPE_CHECKING:
+    import language_tool_python
 
 logger = logging.getLogger(__name__)
 
+# language_tool_python materializes every suggestion when it builds a Match, so
+# this only bounds what we copy and serialize, not what crosses from Java.
+MAX_REPLACEMENTS = 5
+
+# Editors re-check unchanged text on every keystroke; remember recent results.
+CHECK_CACHE_SIZE = 512
+
+
+def _match_attr_names(match: object) -> tuple[str | None, str]:
+    """Return the (error length, rule id) attribute names used by this language_tool_python.
+
+    Releases up to 2.7 expose camelCase ``errorLength``/``ruleId``; 2.8 and later
+    use snake_case. The error length name is None when the match carries neither.
+    """
+    if hasattr(match, "errorLength"):
+        length_attr: str | None = "errorLength"
+    elif hasattr(match, "error_length"):
+        length_attr = "error_length"
+    else:
+        length_attr = None
+    return length_attr, "ruleId" if hasattr(match, "ruleId") else "rule_id"
+
+
 class GrammarCheckService:
-    def __init__(self) -> None:
-        logger.info(f"Python process PATH: {os.environ.get('PATH')}")
-        logger.info(f"Python process JAVA_HOME: {os.environ.get('JAVA_HOME')}")
+    """Runs LanguageTool checks on worker threads so the event loop never blocks on the JVM.
+
+    Each of the ``pool_size`` LanguageTool instances owns its own Java server,
+    so concurrent checks run in parallel instead of queueing on one pipe. The
+    servers are started by the first check, not at construction.
+    """
+
+    def __init__(self, *, pool_size: int = 1) -> None:
+        self._pool_size = max(1, pool_size)
         self._init_error: str | None = None
+        self._enabled: bool | None = None
+        self._init_lock = asyncio.Lock()
+        self._idle_tools: list[language_tool_python.LanguageTool] = []
+        self._semaphore = asyncio.Semaphore(self._pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="languagetool")
+        self._cache: OrderedDict[tuple[bytes, frozenset[str]], CheckResponse] = OrderedDict()
+        # Resolved from the first match seen; the installed library never changes underneath us.
+        self._match_attrs: tuple[str | None, str] | None = None
+
+    def _start_tools(self) -> None:
+        """Import language_tool_python and start the Java servers (blocking)."""
+        logger.info("Python process PATH: %s", os.environ.get("PATH"))
+        logger.info("Python process JAVA_HOME: %s", os.environ.get("JAVA_HOME"))
+        tools: list[language_tool_python.LanguageTool] = []
         try:
-            self._tool = language_tool_python.LanguageTool("en-US")
-            self._enabled = True
+            import language_tool_python
+
+            for _ in range(self._pool_size):
+                tools.append(language_tool_python.LanguageTool("en-US"))
         except Exception as e:
             self._init_error = str(e)
-            logger.warning(f"Failed to initialize LanguageTool (Java likely missing): {e}")
-            self._tool = None
+            logger.warning("Failed to initialize LanguageTool (Java likely missing): %s", e)
+            for tool in tools:
+                tool.close()
             self._enabled = False
+            return
+        self._idle_tools = tools
+        self._enabled = True
+
+    async def _ensure_started(self) -> bool:
+        """Start LanguageTool on first use; later calls return the cached outcome."""
+        if self._enabled is None:
+            async with self._init_lock:
+                if self._enabled is None:
+                    await asyncio.get_running_loop().run_in_executor(self._executor, self._start_tools)
+        return bool(self._enabled)
 
-    def is_enabled(self) -> bool:
-        """Return whether LanguageTool is active."""
+    def is_enabled(self) -> bool | None:
+        """Return whether LanguageTool is active, or None before the first check starts it."""
         return self._enabled
 
     def get_init_error(self) -> str | None:
         """Return initialization error message, if any."""
         return self._init_error
 
-    def check(
+    async def check(
         self, text: str, config: LanguageToolConfig | None = None
     ) -> CheckResponse:
-        if not self._enabled or not self._tool:
+        if not await self._ensure_started():
             return CheckResponse(matches=[], error=self._init_error or "LanguageTool not initialized")
 
-        try:
-            matches = self._tool.check(text)
-        except Exception as e:
-            logger.error(f"Error during grammar check: {e}")
-            return CheckResponse(matches=[], error=f"Grammar check failed: {e}")
+        disabled_categories = config.disabled_categories_upper if config else frozenset()
+
+        # Hash the text so long documents don't stay pinned in memory as keys.
+        cache_key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), disabled_categories)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            return cached
+
+        async with self._semaphore:
+            # The semaphore guarantees an idle tool; no await between pop and use.
+            tool = self._idle_tools.pop()
+            try:
+                matches = await asyncio.get_running_loop().run_in_executor(self._executor, tool.check, text)
+            except Exception as e:
+                logger.error("Error during grammar check: %s", e)
+                return CheckResponse(matches=[], error=f"Grammar check failed: {e}")
+            finally:
+                self._idle_tools.append(tool)
 
-        # Build set of disabled categories for filtering
-        disabled_categories: set[str] = set()
-        if config and config.disabled_categories:
-            disabled_categories = {cat.upper() for cat in config.disabled_categories}
+        if matches and self._match_attrs is None:
+            self._match_attrs = _match_attr_names(matches[0])
+        length_attr, rule_id_attr = self._match_attrs or (None, "rule_id")
 
+        text_len = len(text)
+        # Matches share a handful of categories; decide each one once per check.
+        category_disabled: dict[str, bool] = {}
         errors = []
         for match in matches:
             # Skip matches in disabled categories
-            if match.category.upper() in disabled_categories:
-                continue
+            if disabled_categories:
+                disabled = category_disabled.get(match.category)
+                if disabled is None:
+                    disabled = category_disabled[match.category] = match.category.upper() in disabled_categories
+                if disabled:
+                    continue
             # Build context from the original text (show ~40 chars before/after the error)
-            # Handle potential attribute naming differences in language_tool_python versions
-            error_length = getattr(match, "errorLength", getattr(match, "error_length", None))
+            error_length = getattr(match, length_attr) if length_attr else None
             if error_length is None:
                 # Fallback: try to guess from context or default to 1
                 error_length = len(match.context) if match.context else 1
             
-            context_start = max(0, match.offset - 40)
-            context_end = min(len(text), match.offset + error_length + 40)
+            offset = match.offset
+            context_start = offset - 40
+            if context_start < 0:
+                context_start = 0
+            context_end = offset + error_length + 40
+            if context_end > text_len:
+                context_end = text_len
             context = text[context_start:context_end]
-            offset_in_context = match.offset - context_start
+            offset_in_context = offset - context_start
 
             errors.append(
-                GrammarError(
-                    message=match.message,
-                    offset=match.offset,
-                    length=error_length,
-                    replacements=match.replacements[:5],  # Limit to top 5 suggestions
-                    rule_id=match.rule_id,
-                    category=match.category,
-                    context=context,
-                    sentence=context,  # Use context as sentence for now
-                    offset_in_context=offset_in_context,
-                )
+                {
+                    "message": match.message,
+                    "offset": offset,
+                    "length": error_length,
+                    "replacements": match.replacements[:MAX_REPLACEMENTS],
+                    "rule_id": getattr(match, rule_id_attr),
+                    "category": match.category,
+                    "context": context,
+                    "sentence": context,  # Use context as sentence for now
+                    "offset_in_context": offset_in_context,
+                }
             )
 
-        return CheckResponse(matches=errors)
+        # One pydantic-core pass over plain dicts beats constructing each
+        # GrammarError separately; model_construct is slower still (pure Python).
+        response = CheckResponse.model_validate({"matches": errors, "error": None})
+        self._cache[cache_key] = response
+        if len(self._cache) > CHECK_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return response
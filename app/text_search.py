@@ -0,0 +1,18 @@
+"""Substring location helpers for mapping LLM quotes back onto the input text."""
+
+from __future__ import annotations
+
+
+def find_first_offsets(text: str, needles: list[str]) -> list[int]:
+    """Return the first offset of each needle in text, or -1 when absent.
+
+    Equivalent to ``[text.find(n) for n in needles]``. A single analysis reply
+    carries only a handful of quotes, where repeated str.find beats a
+    multi-pattern automaton, so each distinct needle is simply searched once.
+    """
+    unique = set(needles)
+    if len(unique) == len(needles):
+        return [text.find(needle) for needle in needles]
+    # LLMs often repeat a quote across issues; scan for each distinct one once.
+    found = {needle: text.find(needle) for needle in unique}
+    return [found[needle] for needle in needles]
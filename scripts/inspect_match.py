@@ -1,7 +1,14 @@
+import os
+
 import language_tool_python
 
-tool = language_tool_python.LanguageTool('en-US')
-matches = tool.check("I has a apple.")
+# Point at an already running LanguageTool server (e.g. http://localhost:8081)
+# to skip the JVM start and rule loading on every run.
+remote_server = os.environ.get("LANGUAGE_TOOL_SERVER") or None
+
+with language_tool_python.LanguageTool('en-US', remote_server=remote_server) as tool:
+    matches = tool.check("I has a apple.")
+
 if matches:
     m = matches[0]
     print(f"Attributes: {dir(m)}")
@@ -9,12 +16,12 @@ if matches:
         print(f"errorLength: {m.errorLength}")
     except AttributeError:
         print("errorLength not found")
-    
+
     try:
         print(f"len: {m.len}")
     except AttributeError:
         print("len not found")
-        
+
     try:
         print(f"length: {m.length}")
     except AttributeError:
@@ -10,16 +10,15 @@ import httpx
 API_URL = "http://localhost:8000/v1/text/edit"
 
 
-def run_sample(text: str, payload: dict[str, Any]) -> None:
+def run_sample(client: httpx.Client, text: str, payload: dict[str, Any]) -> None:
     """Send a sample request and dump the response."""
-    with httpx.Client(timeout=60.0) as client:
-        response = client.post(API_URL, json={"text": text, **payload})
-        response.raise_for_status()
-        data = response.json()
-        print(f"Mode: {data['mode']}")
-        print(f"Model: {data['model']['name']}")
-        print(f"Output: {data['output_text']}")
-        print("-" * 60)
+    response = client.post(API_URL, json={"text": text, **payload})
+    response.raise_for_status()
+    data = response.json()
+    print(f"Mode: {data['mode']}")
+    print(f"Model: {data['model']['name']}")
+    print(f"Output: {data['output_text']}")
+    print("-" * 60)
 
 
 def main() -> None:
@@ -32,8 +31,10 @@ def main() -> None:
         {"mode": "technical", "extra_instructions": "Focus on practical remediation."},
     ]
 
-    for payload in scenarios:
-        run_sample(sample_text, payload)
+    # One client for all scenarios so the connection is kept alive between them.
+    with httpx.Client(timeout=60.0) as client:
+        for payload in scenarios:
+            run_sample(client, sample_text, payload)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+"""Shared pytest setup."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Must run before any ``app`` import: settings are read once at import time, and
+# the runtime config would otherwise land in the developer's config/ directory.
+os.environ["CONFIG_PATH"] = str(Path(__file__).with_name("tmp_runtime_config.json").absolute())
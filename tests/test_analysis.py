@@ -0,0 +1,31 @@
+"""Tests for analysis prompt assembly."""
+
+from __future__ import annotations
+
+from app.config import ModelConfig
+from app.models.client import ModelClient
+from app.services.analysis import FEW_SHOT_MAX_WORDS, PROMPT_CACHE_KEY, AnalysisService
+
+
+def test_few_shot_example_only_for_short_texts() -> None:
+    """Long inputs skip the few-shot example to save prompt tokens."""
+    short = AnalysisService._build_messages("The report was written.")
+    long = AnalysisService._build_messages("word " * FEW_SHOT_MAX_WORDS)
+
+    assert [message["role"] for message in short] == ["system", "user", "assistant", "user"]
+    assert [message["role"] for message in long] == ["system", "user"]
+    assert long[-1]["content"] == "word " * FEW_SHOT_MAX_WORDS
+
+
+def test_prompt_cache_key_sent_only_to_openai_endpoints() -> None:
+    """OpenAI-style payloads carry the cache key; Ollama payloads, which have no such field, do not."""
+    messages = AnalysisService._build_messages("The report was written.")
+    payloads = {
+        api_type: ModelClient(
+            ModelConfig(name="m", endpoint="http://x", api_type=api_type, temperature=0.1, max_tokens=8, top_p=0.9)
+        )._build_payload(messages, prompt_cache_key=PROMPT_CACHE_KEY)
+        for api_type in ("ollama", "openai")
+    }
+
+    assert "prompt_cache_key" not in payloads["ollama"]
+    assert payloads["openai"]["prompt_cache_key"] == PROMPT_CACHE_KEY
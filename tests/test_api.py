@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
-import os
-from pathlib import Path
+import asyncio
+import json
+from collections.abc import Callable, Iterator
 from typing import Any
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-os.environ["CONFIG_PATH"] = str(Path("tests/tmp_runtime_config.json").absolute())
-
 from app.config import ModelConfig
 from app.config_manager import ConfigManager
+from app.json_utils import loads
 from app.main import app, config_manager, get_editing_service
+from app.models import client as model_client
 from app.services.editing import EditResult
 
+Handler = Callable[[httpx.Request], httpx.Response]
+
 
 class DummyEditingService:
     """Fake editing service used for endpoint tests."""
@@ -52,6 +56,36 @@ def client_fixture() -> TestClient:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(name="ollama")
+def ollama_fixture(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[Handler], None]]:
+    """Route model client calls through an httpx MockTransport with the given handler."""
+    fake_clients: list[httpx.AsyncClient] = []
+
+    def install(handler: Handler) -> None:
+        fake_http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        fake_clients.append(fake_http)
+        monkeypatch.setattr(model_client, "get_http_client", lambda: fake_http)
+
+    yield install
+    for fake_http in fake_clients:
+        asyncio.run(fake_http.aclose())
+
+
+def clarity_chunk(*issues: dict[str, str]) -> dict[str, Any]:
+    """Build one Ollama stream chunk carrying a report_clarity_issues tool call."""
+    return {
+        "message": {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [{"function": {"name": "report_clarity_issues", "arguments": {"issues": list(issues)}}}],
+        },
+        "done": False,
+    }
+
+
+PASSIVE_ISSUE = {"quoted_text": "was written", "issue_type": "passive_voice", "suggestion": "wrote"}
+
+
 def test_health_endpoint() -> None:
     """Health endpoint should return ok."""
     client = TestClient(app)
@@ -59,6 +93,7 @@ def test_health_endpoint() -> None:
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "ok"
+    assert data["language_tool_status"] == "ok"
 
 
 def test_edit_endpoint_proofread(client: TestClient) -> None:
@@ -116,3 +151,58 @@ def test_runtime_models_endpoint(monkeypatch: pytest.MonkeyPatch) -> None:
     response = client.get("/runtime/models")
     assert response.status_code == 200
     assert response.json()["models"] == ["demo-a", "demo-b"]
+
+
+def test_analyze_stream_endpoint(ollama: Callable[[Handler], None]) -> None:
+    """Streaming analysis emits one NDJSON line per located issue."""
+    chunks = [
+        {"message": {"role": "assistant", "content": ""}, "done": False},
+        clarity_chunk(PASSIVE_ISSUE, {"quoted_text": "not in text", "issue_type": "wordiness", "suggestion": "x"}),
+        {"message": {"role": "assistant", "content": ""}, "done": True},
+    ]
+    body = "\n".join(json.dumps(chunk) for chunk in chunks)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert loads(request.content)["stream"] is True
+        return httpx.Response(200, text=body)
+
+    ollama(handler)
+    client = TestClient(app)
+    response = client.post("/v1/text/analyze/stream", json={"text": "The report was written."})
+    assert response.status_code == 200
+    issues = [loads(line) for line in response.text.splitlines()]
+    assert [(issue["offset"], issue["quoted_text"]) for issue in issues] == [(11, "was written")]
+
+
+def test_analyze_stream_reports_model_failures(ollama: Callable[[Handler], None]) -> None:
+    """A failed model call is a 502, and an error mid-stream ends with an error line."""
+    responses = [
+        httpx.Response(500, text="boom"),
+        httpx.Response(
+            200, text="\n".join(json.dumps(chunk) for chunk in (clarity_chunk(PASSIVE_ISSUE), {"error": "model crashed"}))
+        ),
+    ]
+    ollama(lambda request: responses.pop(0))
+    client = TestClient(app)
+
+    response = client.post("/v1/text/analyze/stream", json={"text": "The report was written."})
+    assert response.status_code == 502
+
+    response = client.post("/v1/text/analyze/stream", json={"text": "The report was written."})
+    assert response.status_code == 200
+    lines = [loads(line) for line in response.text.splitlines()]
+    assert lines[0]["quoted_text"] == "was written"
+    assert "model crashed" in lines[-1]["error"]
+
+
+def test_openapi_documents_json_body_routes() -> None:
+    """Routes reading raw JSON bodies still publish their request schema and 422 response."""
+    spec = app.openapi()
+    for path, model in (("/v1/text/edit", "EditRequest"), ("/v1/text/check", "CheckRequest")):
+        operation = spec["paths"][path]["post"]
+        assert operation["requestBody"]["content"]["application/json"]["schema"] == {
+            "$ref": f"#/components/schemas/{model}"
+        }
+        assert "422" in operation["responses"]
+        assert model in spec["components"]["schemas"]
+    assert "LanguageToolConfig" in spec["components"]["schemas"]
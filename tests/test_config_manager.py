@@ -0,0 +1,40 @@
+"""Tests for runtime configuration management."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.config_manager import ConfigManager
+
+
+def test_model_config_follows_runtime_update(tmp_path: Path) -> None:
+    """Cached model configs are rebuilt when the runtime config changes."""
+    manager = ConfigManager(tmp_path / "runtime_config.json")
+    assert manager.get_model_config("analysis") == manager.get_model_config("grammar")
+
+    manager.update_runtime_config(ollama_base_url="http://localhost:11434/", grammar_model="demo-model")
+    config = manager.get_model_config("grammar")
+    assert config.name == "demo-model"
+    assert config.endpoint == "http://localhost:11434/api/chat"
+    assert manager.get_model_config("general").temperature == 0.5
+
+
+def test_unchanged_update_skips_disk_write(tmp_path: Path) -> None:
+    """Updating with the current values leaves the persisted file untouched."""
+    path = tmp_path / "runtime_config.json"
+    manager = ConfigManager(path)
+    current = manager.get_runtime_config()
+    path.write_text("sentinel", encoding="utf-8")
+
+    assert manager.update_runtime_config(grammar_model=f" {current.grammar_model} ") is current
+    assert path.read_text(encoding="utf-8") == "sentinel"
+
+
+def test_config_is_loaded_on_first_access(tmp_path: Path) -> None:
+    """Constructing the manager does not touch disk."""
+    path = tmp_path / "nested" / "runtime_config.json"
+    manager = ConfigManager(path)
+    assert not path.parent.exists()
+
+    assert manager.get_model_config("general").name == manager.get_runtime_config().general_model
+    assert path.exists()
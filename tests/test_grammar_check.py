@@ -0,0 +1,123 @@
+"""Tests for the LanguageTool-backed grammar service."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import language_tool_python
+import pytest
+
+from app.schemas import LanguageToolConfig
+from app.services import grammar_check
+
+
+class FakeLanguageTool:
+    """Stands in for language_tool_python.LanguageTool without a JVM."""
+
+    def __init__(self, language: str) -> None:
+        self.language = language
+
+    def check(self, text: str) -> list[SimpleNamespace]:
+        offset = text.index("has")
+        return [
+            SimpleNamespace(
+                message="Possible agreement error.",
+                offset=offset,
+                error_length=3,
+                replacements=["have", "had", "having", "hath", "haves", "halve"],
+                rule_id="HE_VERB_AGR",
+                category="GRAMMAR",
+                context=text,
+            ),
+            SimpleNamespace(
+                message="Style nit.",
+                offset=0,
+                error_length=1,
+                replacements=[],
+                rule_id="STYLE_RULE",
+                category="Style",
+                context=text,
+            ),
+        ]
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(name="service")
+def service_fixture(monkeypatch: pytest.MonkeyPatch) -> grammar_check.GrammarCheckService:
+    monkeypatch.setattr(language_tool_python, "LanguageTool", FakeLanguageTool)
+    return grammar_check.GrammarCheckService(pool_size=2)
+
+
+def test_check_builds_errors_with_context(service: grammar_check.GrammarCheckService) -> None:
+    """Matches are converted, filtered by category and trimmed to the replacement cap."""
+    text = "I has a apple."
+    config = LanguageToolConfig(disabled_categories=["style"])
+    response = asyncio.run(service.check(text, config))
+
+    assert response.error is None
+    assert [error.rule_id for error in response.matches] == ["HE_VERB_AGR"]
+    error = response.matches[0]
+    assert (error.offset, error.length) == (2, 3)
+    assert error.replacements == ["have", "had", "having", "hath", "haves"]
+    assert error.context[error.offset_in_context:error.offset_in_context + error.length] == "has"
+
+
+def test_camel_case_match_attributes(
+    service: grammar_check.GrammarCheckService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Matches from language_tool_python 2.7 (errorLength/ruleId) are read too."""
+
+    def camel_check(self: FakeLanguageTool, text: str) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(
+                message="Possible agreement error.",
+                offset=2,
+                errorLength=3,
+                replacements=["have"],
+                ruleId="HE_VERB_AGR",
+                category="GRAMMAR",
+                context=text,
+            )
+        ]
+
+    monkeypatch.setattr(FakeLanguageTool, "check", camel_check)
+    response = asyncio.run(service.check("I has a apple."))
+
+    assert [(error.rule_id, error.length) for error in response.matches] == [("HE_VERB_AGR", 3)]
+
+
+def test_concurrent_checks_share_the_pool(service: grammar_check.GrammarCheckService) -> None:
+    """Concurrent checks borrow and return pooled tools."""
+
+    async def run_many() -> list[int]:
+        responses = await asyncio.gather(*(service.check("He has it.") for _ in range(5)))
+        return [len(response.matches) for response in responses]
+
+    assert service.is_enabled() is None
+    assert asyncio.run(run_many()) == [2] * 5
+    assert service.is_enabled()
+
+
+def test_repeated_check_is_served_from_cache(
+    service: grammar_check.GrammarCheckService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Identical text and config reuse the previous result; a different config re-runs the check."""
+    calls: list[str] = []
+    original = FakeLanguageTool.check
+
+    def counting_check(self: FakeLanguageTool, text: str) -> list[SimpleNamespace]:
+        calls.append(text)
+        return original(self, text)
+
+    monkeypatch.setattr(FakeLanguageTool, "check", counting_check)
+
+    first = asyncio.run(service.check("He has it."))
+    assert asyncio.run(service.check("He has it.")) is first
+    assert len(calls) == 1
+
+    filtered = asyncio.run(service.check("He has it.", LanguageToolConfig(disabled_categories=["STYLE"])))
+    assert len(filtered.matches) == 1
+    assert len(calls) == 2
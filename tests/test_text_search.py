@@ -0,0 +1,18 @@
+"""Tests for quote location helpers."""
+
+from __future__ import annotations
+
+from app.text_search import find_first_offsets
+
+
+def test_find_first_offsets_matches_str_find() -> None:
+    """Offsets agree with str.find, including overlaps, duplicates and misses."""
+    text = "the cat sat on the mat; the cat sat again"
+    needles = ["the cat", "cat sat", "sat again", "missing", "the cat", "at", "t"]
+    assert find_first_offsets(text, needles) == [text.find(needle) for needle in needles]
+
+
+def test_find_first_offsets_small_inputs() -> None:
+    """Misses and empty needle lists are handled."""
+    assert find_first_offsets("abcabc", ["bc", "zz"]) == [1, -1]
+    assert find_first_offsets("abc", []) == []